@@ -1,5 +1,4 @@
 from pathlib import Path
-import traceback
 from typing import Optional
 from ocean_runner import Algorithm
 
@@ -37,6 +36,7 @@ class AgeAverageAlgorithm(BaseAlgorithm):
         self.request = deps.request  # Set for base class generic validations
         self.response = deps.response
         self.calculate_action = calculate_action
+        self.performance_monitoring_enabled = config.performance.monitoring_enabled
         self._validation_error: Optional[Exception] = None  # Store validation errors
         
         # Register callbacks with the ocean_runner framework
@@ -85,23 +85,23 @@ class AgeAverageAlgorithm(BaseAlgorithm):
         Args:
             algo: Ocean Protocol algorithm instance
         """
+        logger = algo.logger
         try:
-            algo.logger.info("validate: starting - validating custom parameters")
+            logger.info("validate: starting - validating custom parameters")
             
             # Get custom parameters from both sources
             params = self.request.get_custom_parameters()        
             age = params.get('age')
             
             if age is None:
-                algo.logger.error("Validation failed: Missing required parameter 'age'")
+                logger.error("Validation failed: Missing required parameter 'age'")
                 raise ValidationError("Missing required parameter: age")
             
-            algo.logger.info(f"Validation successful - age parameter: {age}")
+            logger.info("Validation successful - age parameter: %s", age)
             
         except Exception as e:
-            # Capture error and log traceback
-            algo.logger.error(f"Validation error: {e}")
-            algo.logger.error(f"Validation error traceback:\n{traceback.format_exc()}")
+            # Capture error and log it with its traceback
+            logger.exception("Validation error: %s", e)
             self._validation_error = e
     
     def run(self, algo: Algorithm) -> AgeResponseDTO:
@@ -122,36 +122,24 @@ class AgeAverageAlgorithm(BaseAlgorithm):
         Returns:
             AgeResponseDTO: Always returns a DTO (success or error)
         """
-        algo.logger.info("run: starting")
+        logger = algo.logger
+        logger.info("run: starting")
         
         # Check if validation failed
         if self._validation_error:
-            algo.logger.info("Returning error response due to validation failure")
-            return AgeResponseDTO(
-                status="error",
-                message=f"Validation error: {str(self._validation_error)}",
-                min_age=0,
-                max_age=0,
-                avg_age=0.0,
-            )
+            logger.info("Returning error response due to validation failure")
+            return AgeResponseDTO.error(f"Validation error: {str(self._validation_error)}")
         
         try:
             # Delegate business logic to the action
             result = self.calculate_action.execute()
-            algo.logger.info(f"Algorithm completed successfully: {result.status}")
+            logger.info("Algorithm completed successfully: %s", result.status)
             return result
             
         except Exception as e:
             # Catch-all for any unexpected errors
-            algo.logger.error(f"Unexpected error in algorithm execution: {e}")
-            algo.logger.error(f"Full traceback:\n{traceback.format_exc()}")
-            return AgeResponseDTO(
-                status="error",
-                message=f"Algorithm error: {str(e)}",
-                min_age=0,
-                max_age=0,
-                avg_age=0.0,
-            )
+            logger.exception("Unexpected error in algorithm execution: %s", e)
+            return AgeResponseDTO.error(f"Algorithm error: {str(e)}")
     
     def save(
         self,
@@ -171,21 +159,19 @@ class AgeAverageAlgorithm(BaseAlgorithm):
             results: ResponseDTO object to save (can be success or error)
             base_path: Base directory for output files
         """
-        algo.logger.info("save: starting")
+        logger = algo.logger
+        logger.info("save: starting")
 
         try:
             # Write results to configured output file
-            output_filename = self.config.output.filename
-            output_file = base_path / output_filename
+            output_file = base_path / self.config.output.filename
             self.response.write_results(results, output_file)
-            algo.logger.info(f"Results saved successfully to {output_file}")
+            logger.info("Results saved successfully to %s", output_file)
 
         except FileOperationError as e:
-            algo.logger.error(f"Failed to save results: {e}")
-            algo.logger.error(f"File operation error traceback:\n{traceback.format_exc()}")
+            logger.exception("Failed to save results: %s", e)
             raise
             
         except Exception as e:
-            algo.logger.error(f"Unexpected error during save: {e}")
-            algo.logger.error(f"Full traceback:\n{traceback.format_exc()}")
+            logger.exception("Unexpected error during save: %s", e)
             raise
@@ -1,13 +1,9 @@
 """Action for calculating age statistics from input files."""
 
-from typing import List
-from statistics import mean
+import numpy as np
 
-from age_average.domain.age_request_dto import AgeRequestDTO
+from age_average.domain.age_repository_interface import AgeRepositoryInterface
 from age_average.domain.age_response_dto import AgeResponseDTO
-from age_average.domain.user_age import UserAge
-from age_average.infrastructure.user_age_ocean_repository import UserAgeOceanRepository
-from shared.domain.repository_interface import RepositoryInterface
 from shared.domain.exceptions.calculation_error import CalculationError
 
 
@@ -21,12 +17,12 @@ class CalculateAgeStatisticsAction:
     Follows SOLID DIP: all dependencies injected via constructor.
     """
 
-    def __init__(self, repository: RepositoryInterface):
+    def __init__(self, repository: AgeRepositoryInterface):
         """
         Initialize action with repository dependency.
 
         Args:
-            repository: Repository that handles age statistics calculations
+            repository: Repository providing the loaded UserAge entities and their ages column
         """
         self.repository = repository
 
@@ -38,10 +34,10 @@ class CalculateAgeStatisticsAction:
             AgeResponseDTO with calculated statistics from input data or error status
         """
         try:
-            # Retrieve loaded entities (automatically loaded in constructor)
-            user_ages = self.repository.find_all()
+            # Retrieve the ages column of the loaded entities (loaded on first access)
+            ages = self.repository.find_all_ages_array()
 
-            if not user_ages:
+            if ages.size == 0:
                 return AgeResponseDTO(
                     status="success",
                     message="No data available for statistics calculation",
@@ -50,15 +46,15 @@ class CalculateAgeStatisticsAction:
                     avg_age=0.0,
                 )
 
-            # Calculate statistics
-            ages = [user_age.age for user_age in user_ages]
-            min_age = min(ages)
-            max_age = max(ages)
-            avg_age = round(mean(ages), 1)
+            # Calculate statistics with vectorized reductions
+            min_age = int(ages.min())
+            max_age = int(ages.max())
+            total = int(ages.sum(dtype=np.int64))
+            avg_age = round(total / ages.size, 1)
 
             return AgeResponseDTO(
                 status="success",
-                message=f"Statistics calculated from {len(user_ages)} records",
+                message=f"Statistics calculated from {ages.size} records",
                 min_age=min_age,
                 max_age=max_age,
                 avg_age=avg_age,
@@ -66,10 +62,4 @@ class CalculateAgeStatisticsAction:
 
         except Exception as e:
             # Return error response instead of raising exception
-            return AgeResponseDTO(
-                status="error",
-                message=f"Failed to calculate age statistics: {str(e)}",
-                min_age=0,
-                max_age=0,
-                avg_age=0.0,
-            )
\ No newline at end of file
+            return AgeResponseDTO.error(f"Failed to calculate age statistics: {str(e)}")
\ No newline at end of file
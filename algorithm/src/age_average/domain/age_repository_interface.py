@@ -0,0 +1,28 @@
+"""Repository interface for the age_average bounded context."""
+
+from abc import abstractmethod
+
+import numpy as np
+
+from age_average.domain.user_age import UserAge
+from shared.domain.repository_interface import RepositoryInterface
+
+
+class AgeRepositoryInterface(RepositoryInterface[UserAge, int]):
+    """
+    Repository interface for UserAge entities.
+
+    Extends the generic RepositoryInterface with the column-oriented query
+    needed by the age statistics use case, so the application layer depends
+    on this abstraction rather than on an infrastructure implementation.
+    """
+
+    @abstractmethod
+    def find_all_ages_array(self) -> np.ndarray:
+        """
+        Get the ages of all entities as a contiguous column.
+
+        Returns:
+            Read-only uint8 array with one age per entity
+        """
+        pass
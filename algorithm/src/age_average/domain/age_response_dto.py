@@ -8,3 +8,26 @@ class AgeResponseDTO(ResponseDTO):
     min_age: int
     max_age: int
     avg_age: float
+
+    @classmethod
+    def error(cls, message: str) -> "AgeResponseDTO":
+        """
+        Factory method to create an error response with zeroed statistics.
+
+        Uses regular construction rather than model_construct: pydantic-core
+        validates these five scalars faster than model_construct assigns them
+        in Python.
+
+        Args:
+            message: Description of the failure
+
+        Returns:
+            AgeResponseDTO with status "error" and zeroed statistics
+        """
+        return cls(
+            status="error",
+            message=message,
+            min_age=0,
+            max_age=0,
+            avg_age=0.0,
+        )
@@ -3,14 +3,15 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserAge:
     """
     Entity representing a user with their age.
 
     This is a simple domain entity that encapsulates user identification
     and age information. The entity is immutable (frozen) to ensure
-    data integrity.
+    data integrity, and uses __slots__ to keep per-instance memory low
+    when mapping large inputs.
 
     Attributes:
         user_id: Unique identifier for the user
@@ -9,6 +9,9 @@ from shared.domain.request_dto import RequestDTO
 from shared.domain.exceptions.validation_error import ValidationError
 from shared.domain.exceptions.parsing_error import ParsingError
 
+MIN_AGE = 0
+MAX_AGE = 150
+
 
 class UserAgeMapper(MapperInterface[UserAge]):
     """
@@ -41,30 +44,32 @@ class UserAgeMapper(MapperInterface[UserAge]):
             raise ValidationError(f"Requests must be a list, got {type(requests)}")
 
         user_ages = []
+        append = user_ages.append
 
         for i, request in enumerate(requests):
             try:
+                # Read each field once; a missing attribute is treated like None
+                user_id = getattr(request, 'user_id', None)
+                age = getattr(request, 'age', None)
+
                 # Validate required fields
-                if not hasattr(request, 'user_id') or request.user_id is None:
+                if user_id is None:
                     raise ValidationError(f"Request at index {i} missing required field 'user_id'")
 
-                if not hasattr(request, 'age') or request.age is None:
+                if age is None:
                     raise ValidationError(f"Request at index {i} missing required field 'age'")
 
                 # Validate data types and ranges
-                if not isinstance(request.user_id, int) or request.user_id < 0:
-                    raise ValidationError(f"Request at index {i}: 'user_id' must be a non-negative integer, got {request.user_id}")
+                if not isinstance(user_id, int) or user_id < 0:
+                    raise ValidationError(f"Request at index {i}: 'user_id' must be a non-negative integer, got {user_id}")
 
-                if not isinstance(request.age, int) or request.age < 0 or request.age > 150:
-                    raise ValidationError(f"Request at index {i}: 'age' must be an integer between 0 and 150, got {request.age}")
+                if not isinstance(age, int) or not MIN_AGE <= age <= MAX_AGE:
+                    raise ValidationError(f"Request at index {i}: 'age' must be an integer between {MIN_AGE} and {MAX_AGE}, got {age}")
 
                 # Create UserAge entity
-                user_age = UserAge.create(
-                    user_id=request.user_id,
-                    age=request.age
-                )
+                user_age = UserAge.create(user_id=user_id, age=age)
 
-                user_ages.append(user_age)
+                append(user_age)
 
             except AttributeError as e:
                 raise ParsingError(f"Failed to parse request at index {i}: {e}")
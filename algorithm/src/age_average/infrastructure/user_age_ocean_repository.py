@@ -1,19 +1,26 @@
 """Repository for Age Average calculations."""
 
+from typing import Optional, Type
+
+import numpy as np
+
+from age_average.domain.age_repository_interface import AgeRepositoryInterface
 from age_average.domain.age_request_dto import AgeRequestDTO
 from age_average.domain.user_age import UserAge
 from age_average.infrastructure.user_age_mapper import UserAgeMapper
+from shared.domain.request_dto import RequestDTO
 from shared.infrastructure.request import Request
 from shared.infrastructure.repositories.ocean_in_memory_repository import OceanInMemoryRepository
 
 
-class UserAgeOceanRepository(OceanInMemoryRepository[UserAge, int]):
+class UserAgeOceanRepository(OceanInMemoryRepository[UserAge, int], AgeRepositoryInterface):
     """
     Repository for UserAge entities with Ocean Protocol integration and in-memory storage.
 
     This repository extends OceanInMemoryRepository to provide operations for
     UserAge entities while inheriting Ocean Protocol data access and in-memory
-    storage capabilities.
+    storage capabilities, and implements AgeRepositoryInterface for the
+    application layer.
 
     Follows SOLID DIP: all dependencies injected via constructor.
     """
@@ -31,9 +38,61 @@ class UserAgeOceanRepository(OceanInMemoryRepository[UserAge, int]):
             mapper: UserAgeMapper instance for transforming DTOs to entities
         """
         super().__init__(request, mapper, AgeRequestDTO)
+        self._ages: Optional[np.ndarray] = None
 
-    # All functionality inherited from OceanInMemoryRepository:
-    # - get_entities_from_input(AgeRequestDTO) automatically called in constructor
+    # Functionality inherited from OceanInMemoryRepository:
+    # - get_entities_from_input(AgeRequestDTO) automatically called on first access
     # - find_all() for retrieving loaded entities
+    # - find_by_id(), find_by_ids(), exists_by_id() indexed by user_id
     # - clear(), count() for entity management
     # - save(), delete() blocked (READ-ONLY)
+
+    def clear(self) -> None:
+        """Clear all entities and the cached ages column."""
+        super().clear()
+        self._ages = None
+
+    def find_all_ages_array(self) -> np.ndarray:
+        """
+        Get the ages of all loaded entities as a contiguous column.
+
+        The column is built once per load and reused by subsequent calls, so
+        aggregations can run as vectorized reductions instead of walking the
+        entity list attribute by attribute. UserAgeMapper guarantees ages are
+        within 0-150, so they are stored as single bytes.
+
+        Returns:
+            Read-only uint8 array with one age per loaded entity
+        """
+        self._ensure_loaded()
+        if self._ages is None:
+            ages = np.fromiter(
+                (user_age.age for user_age in self._entities),
+                dtype=np.uint8,
+                count=len(self._entities),
+            )
+            ages.flags.writeable = False
+            self._ages = ages
+        return self._ages
+
+    def get_entities_from_input(self, dto_class: Type[RequestDTO]) -> None:
+        """
+        Load entities from input files and invalidate the cached ages column.
+
+        Args:
+            dto_class: The DTO class to use for parsing input data
+        """
+        self._ages = None
+        super().get_entities_from_input(dto_class)
+
+    def _get_entity_id(self, entity: UserAge) -> int:
+        """
+        Identify UserAge entities by their user_id.
+
+        Args:
+            entity: The UserAge entity to identify
+
+        Returns:
+            The entity's user_id
+        """
+        return entity.user_id
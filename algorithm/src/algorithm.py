@@ -5,7 +5,7 @@ This module serves as the composition root orchestrator, delegating
 dependency injection to each bounded context's factory method.
 
 Architecture Pattern:
-    1. Load application configuration
+    1. Load application configuration (lazily, on first access to ``algorithm``)
     2. Delegate to bounded context factory (e.g., AgeAverageAlgorithm.create())
     3. Extract Ocean Runner algorithm instance
     4. Execute Ocean Protocol pipeline
@@ -18,12 +18,38 @@ Design Rationale:
 """
 
 # Create algorithm instance using factory method
+from functools import cache
+
+from ocean_runner import Algorithm
+
 from age_average.age_average_algorithm import AgeAverageAlgorithm
 from shared.domain.config.app_config import AppConfig
 
-# Composition Root: Delegate to bounded context factory
-# Note: .algorithm extracts the Ocean Runner instance for execution
-algorithm = AgeAverageAlgorithm.create(AppConfig.load()).algorithm
+
+@cache
+def _get_algorithm() -> Algorithm:
+    """
+    Build the Ocean Runner algorithm instance on first use.
+
+    Returns:
+        Algorithm: The Ocean Runner instance wired by the bounded context factory
+    """
+    # Composition Root: Delegate to bounded context factory
+    # Note: .algorithm extracts the Ocean Runner instance for execution
+    return AgeAverageAlgorithm.create(AppConfig.load()).algorithm
+
+
+def __getattr__(name: str) -> Algorithm:
+    """
+    Resolve the module-level ``algorithm`` attribute lazily (PEP 562).
+
+    Configuration is loaded and dependencies wired on first access to
+    ``algorithm``.
+    """
+    if name == "algorithm":
+        return _get_algorithm()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
-    algorithm()
+    _get_algorithm()()
@@ -1,10 +1,12 @@
 """Algorithm configuration model."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AlgorithmConfig(BaseModel):
     """Algorithm configuration settings."""
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Algorithm name")
     version: str = Field(..., description="Algorithm version")
     description: str = Field(..., description="Algorithm description")
\ No newline at end of file
@@ -1,7 +1,8 @@
 """Main application configuration model."""
 
+from functools import cache
 from pathlib import Path
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .algorithm_config import AlgorithmConfig
 from .data_config import DataConfig
@@ -12,6 +13,8 @@ from .performance_config import PerformanceConfig
 
 class AppConfig(BaseModel):
     """Main application configuration."""
+    model_config = ConfigDict(frozen=True)
+
     algorithm: AlgorithmConfig
     data: DataConfig = Field(default_factory=DataConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
@@ -60,12 +63,17 @@ class AppConfig(BaseModel):
         )
 
     @classmethod
+    @cache
     def load(cls) -> 'AppConfig':
         """
         Load application configuration with automatic path resolution.
         
         This method encapsulates the configuration loading strategy,
-        automatically discovering the config file location.
+        automatically discovering the config file location. The result is
+        cached per process, so repeated calls share one instance instead of
+        re-reading and re-validating the YAML file. The configuration models
+        are frozen, so no caller can change that shared instance. Use
+        from_yaml() to get a fresh instance.
         
         Returns:
             AppConfig: Loaded and validated configuration
@@ -78,8 +86,11 @@ class AppConfig(BaseModel):
         """Load configuration from YAML file."""
         import yaml
 
+        # Prefer the libyaml-backed loader; fall back to pure Python if unavailable
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
         # Load YAML configuration
         with open(yaml_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=loader)
 
         return cls(**data)
\ No newline at end of file
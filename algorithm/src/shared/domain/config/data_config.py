@@ -1,11 +1,15 @@
 """Data processing configuration model."""
 
 from typing import List
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+ALLOWED_FORMATS = ("json", "csv", "xml")
 
 
 class DataConfig(BaseModel):
     """Data processing configuration."""
+    model_config = ConfigDict(frozen=True)
+
     supported_formats: List[str] = Field(default_factory=lambda: ["json"])
     max_file_size_mb: int = Field(default=100, gt=0)
     age_range: dict = Field(default_factory=lambda: {"min": 0, "max": 150})
@@ -13,10 +17,9 @@ class DataConfig(BaseModel):
     @field_validator('supported_formats')
     @classmethod
     def validate_formats(cls, v):
-        allowed = ["json", "csv", "xml"]
         for fmt in v:
-            if fmt not in allowed:
-                raise ValueError(f"Unsupported format: {fmt}. Allowed: {allowed}")
+            if fmt not in ALLOWED_FORMATS:
+                raise ValueError(f"Unsupported format: {fmt}. Allowed: {list(ALLOWED_FORMATS)}")
         return v
 
     @field_validator('age_range')
@@ -1,17 +1,21 @@
 """Logging configuration model."""
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+ALLOWED_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
 
 
 class LoggingConfig(BaseModel):
     """Logging configuration."""
+    model_config = ConfigDict(frozen=True)
+
     level: str = Field(default="INFO")
     format: str = Field(default="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
     @field_validator('level')
     @classmethod
     def validate_level(cls, v):
-        allowed = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in allowed:
-            raise ValueError(f"Invalid log level: {v}. Allowed: {allowed}")
-        return v.upper()
\ No newline at end of file
+        level = v.upper()
+        if level not in ALLOWED_LEVELS:
+            raise ValueError(f"Invalid log level: {v}. Allowed: {list(ALLOWED_LEVELS)}")
+        return level
\ No newline at end of file
@@ -1,10 +1,14 @@
 """Output configuration model."""
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+ALLOWED_OUTPUT_FORMATS = ("json", "xml", "csv")
 
 
 class OutputConfig(BaseModel):
     """Output configuration."""
+    model_config = ConfigDict(frozen=True)
+
     filename: str = Field(default="results.json")
     format: str = Field(default="json")
     indent: int = Field(default=2, ge=0)
@@ -13,7 +17,7 @@ class OutputConfig(BaseModel):
     @field_validator('format')
     @classmethod
     def validate_format(cls, v):
-        allowed = ["json", "xml", "csv"]
-        if v.lower() not in allowed:
-            raise ValueError(f"Unsupported output format: {v}. Allowed: {allowed}")
-        return v.lower()
\ No newline at end of file
+        output_format = v.lower()
+        if output_format not in ALLOWED_OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {v}. Allowed: {list(ALLOWED_OUTPUT_FORMATS)}")
+        return output_format
\ No newline at end of file
@@ -1,9 +1,12 @@
 """Performance configuration model."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PerformanceConfig(BaseModel):
     """Performance configuration."""
+    model_config = ConfigDict(frozen=True)
+
     batch_size: int = Field(default=1000, gt=0)
-    timeout_seconds: int = Field(default=300, gt=0)
\ No newline at end of file
+    timeout_seconds: int = Field(default=300, gt=0)
+    monitoring_enabled: bool = Field(default=True)
\ No newline at end of file
@@ -1,9 +1,11 @@
 """Base ResponseDTO model."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ResponseDTO(BaseModel):
     """Generic base class for algorithm execution response DTOs."""
+    model_config = ConfigDict(frozen=True)
+
     status: str
     message: str
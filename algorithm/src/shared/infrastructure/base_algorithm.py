@@ -27,6 +27,7 @@ class BaseAlgorithm(AlgorithmInterface, ABC):
     def __init__(self):
         """Initialize the base algorithm."""
         self.performance_monitor = None
+        self.performance_monitoring_enabled = True  # May be overridden by concrete algorithms
         self.request = None  # Will be set by concrete algorithms
     
     # Note: `_create_common_dependencies` removed. Bounded contexts should create
@@ -137,9 +138,14 @@ class BaseAlgorithm(AlgorithmInterface, ABC):
         """
         Start performance monitoring for the algorithm execution.
         
+        Does nothing when performance_monitoring_enabled is False.
+        
         Args:
             algo: Algorithm instance with logger
         """
+        if not self.performance_monitoring_enabled:
+            return
+        
         # PerformanceMonitor starts monitoring automatically in its constructor
         self.performance_monitor = PerformanceMonitor(algo.logger)
     
@@ -1,5 +1,7 @@
 """File reading service."""
 
+import os
+import stat
 from pathlib import Path
 from logging import Logger
 
@@ -17,6 +19,11 @@ class FileReader:
         """
         Read text content from a file with error handling.
         
+        The file is opened once and checked through its descriptor, instead of
+        separate exists()/is_file() stat calls beforehand. Opening is
+        non-blocking so FIFOs and other special files are rejected rather than
+        waited on.
+        
         Args:
             path: Path to the file
             
@@ -33,18 +40,32 @@ class FileReader:
         if not isinstance(path, Path):
             raise ValidationError(f"Path must be a Path object, got {type(path)}")
         
-        if not path.exists():
+        try:
+            fd = os.open(path, os.O_RDONLY | getattr(os, "O_NONBLOCK", 0))
+        except FileNotFoundError:
             raise FileOperationError(f"File does not exist: {path}")
+        except IsADirectoryError:
+            raise FileOperationError(f"Path is not a file: {path}")
+        except Exception as e:
+            raise FileOperationError(f"Error reading file {path}: {e}")
         
-        if not path.is_file():
+        try:
+            is_regular_file = stat.S_ISREG(os.fstat(fd).st_mode)
+        except Exception as e:
+            os.close(fd)
+            raise FileOperationError(f"Error reading file {path}: {e}")
+        
+        if not is_regular_file:
+            os.close(fd)
             raise FileOperationError(f"Path is not a file: {path}")
         
         try:
-            content = path.read_text(encoding='utf-8', errors="replace")
-            if not content.strip():
-                raise ValidationError(f"File is empty: {path}")
-            return content
-        except ValidationError:
-            raise  # Re-raise ValidationError without wrapping
+            with os.fdopen(fd, 'rb') as f:
+                raw = f.read()
         except Exception as e:
             raise FileOperationError(f"Error reading file {path}: {e}")
+        
+        content = raw.decode('utf-8', errors="replace")
+        if not content.strip():
+            raise ValidationError(f"File is empty: {path}")
+        return content
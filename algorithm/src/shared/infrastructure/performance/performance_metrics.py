@@ -4,7 +4,7 @@ from typing import Dict, Any
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PerformanceMetrics:
     """Performance metrics data."""
     execution_time_seconds: float
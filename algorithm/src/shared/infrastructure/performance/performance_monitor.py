@@ -2,7 +2,7 @@
 
 import time
 import psutil
-from logging import Logger
+from logging import INFO, Logger
 
 from .performance_metrics import PerformanceMetrics
 
@@ -16,21 +16,24 @@ class PerformanceMonitor:
         self.process = psutil.Process()
         self.memory_start = self.process.memory_info().rss
         self.peak_memory = self.memory_start
+        # Prime the CPU counter so later non-blocking calls measure since start
+        self.process.cpu_percent(interval=None)
 
-    def update_peak_memory(self) -> None:
-        """Update peak memory usage."""
+    def update_peak_memory(self) -> int:
+        """Update peak memory usage and return the current RSS in bytes."""
         current_memory = self.process.memory_info().rss
         if current_memory > self.peak_memory:
             self.peak_memory = current_memory
+        return current_memory
 
     def get_metrics(self) -> PerformanceMetrics:
         """Get current performance metrics."""
-        self.update_peak_memory()
+        # Single memory_info() read shared by the peak update and the usage delta
+        current_memory = self.update_peak_memory()
 
         execution_time = time.time() - self.start_time
-        current_memory = self.process.memory_info().rss
         memory_usage = current_memory - self.memory_start
-        cpu_percent = self.process.cpu_percent(interval=0.1)
+        cpu_percent = self.process.cpu_percent(interval=None)
 
         return PerformanceMetrics(
             execution_time_seconds=execution_time,
@@ -41,6 +44,9 @@ class PerformanceMonitor:
 
     def log_metrics(self, operation: str = "operation") -> None:
         """Log current performance metrics."""
+        if not self.logger.isEnabledFor(INFO):
+            return
+
         metrics = self.get_metrics()
         self.logger.info(
             f"Performance metrics for {operation}: "
@@ -53,6 +59,9 @@ class PerformanceMonitor:
 
     def log_final_metrics(self) -> None:
         """Log final performance metrics at the end of execution."""
+        if not self.logger.isEnabledFor(INFO):
+            return
+
         metrics = self.get_metrics()
         self.logger.info(
             f"Algorithm execution completed: "
@@ -1,8 +1,9 @@
 """In-Memory Ocean Repository for managing entities in memory."""
 
-import json
-from typing import List, Optional, TypeVar, Type
-from pydantic import ValidationError as PydanticValidationError
+import orjson
+from functools import cache
+from typing import Annotated, Dict, Iterable, List, Optional, TypeVar, Type
+from pydantic import Field, TypeAdapter, ValidationError as PydanticValidationError
 
 from shared.infrastructure.repositories.ocean_repository import OceanRepository
 from shared.infrastructure.request import Request
@@ -16,6 +17,24 @@ T = TypeVar('T')  # Type for entities
 ID = TypeVar('ID')  # Type for identifiers
 
 
+@cache
+def _get_list_adapter(dto_class: Type[RequestDTO]) -> TypeAdapter:
+    """
+    Get the TypeAdapter that validates a list of the given DTO class.
+
+    Building a TypeAdapter compiles a validator, so it is done once per DTO
+    class for the whole process. Validation stops at the first invalid item,
+    keeping the error message bounded however large the input array is.
+
+    Args:
+        dto_class: The DTO class to validate list items against
+
+    Returns:
+        TypeAdapter for List[dto_class]
+    """
+    return TypeAdapter(Annotated[List[dto_class], Field(fail_fast=True)])
+
+
 class OceanInMemoryRepository(OceanRepository[T, ID]):
     """
     Base repository for managing entities in memory with Ocean Protocol integration (READ-ONLY).
@@ -48,6 +67,7 @@ class OceanInMemoryRepository(OceanRepository[T, ID]):
         self.dto_class = dto_class
         self._entities: List[T] = []
         self._loaded = False
+        self._index: Optional[Dict[ID, T]] = None
 
     def _ensure_loaded(self) -> None:
         """
@@ -76,8 +96,8 @@ class OceanInMemoryRepository(OceanRepository[T, ID]):
         Find an entity by its identifier in memory.
 
         Automatically loads data from Ocean Protocol inputs if not already loaded.
-        Default implementation returns None.
-        Subclasses should override if entities have identifiers.
+        Lookups go through an identifier index built once per load.
+        Returns None unless a subclass overrides _get_entity_id.
 
         Args:
             id: The identifier of the entity to find
@@ -85,8 +105,22 @@ class OceanInMemoryRepository(OceanRepository[T, ID]):
         Returns:
             The entity if found, None otherwise
         """
-        self._ensure_loaded()
-        return None
+        return self._get_index().get(id)
+
+    def find_by_ids(self, ids: Iterable[ID]) -> Dict[ID, T]:
+        """
+        Find several entities by their identifiers in a single pass.
+
+        Automatically loads data from Ocean Protocol inputs if not already loaded.
+
+        Args:
+            ids: The identifiers of the entities to find
+
+        Returns:
+            Mapping of each found identifier to its entity; missing ids are omitted
+        """
+        index = self._get_index()
+        return {id: index[id] for id in ids if id in index}
 
     def save(self, entity: T) -> T:
         """
@@ -129,8 +163,7 @@ class OceanInMemoryRepository(OceanRepository[T, ID]):
         Check if an entity exists by its identifier in memory.
 
         Automatically loads data from Ocean Protocol inputs if not already loaded.
-        Default implementation returns False.
-        Subclasses should override if entities have identifiers.
+        Returns False unless a subclass overrides _get_entity_id.
 
         Args:
             id: The identifier to check
@@ -138,8 +171,7 @@ class OceanInMemoryRepository(OceanRepository[T, ID]):
         Returns:
             True if an entity with the given identifier exists, False otherwise
         """
-        self._ensure_loaded()
-        return False
+        return id in self._get_index()
 
     def clear(self) -> None:
         """
@@ -148,6 +180,7 @@ class OceanInMemoryRepository(OceanRepository[T, ID]):
         This is useful for testing or resetting the repository state.
         """
         self._entities = []
+        self._index = None
         self._loaded = True # Mark as loaded to prevent re-loading empty state
 
     def count(self) -> int:
@@ -178,6 +211,7 @@ class OceanInMemoryRepository(OceanRepository[T, ID]):
             ParsingError: If JSON parsing or mapping fails
             FileOperationError: If file reading fails
         """
+        self._index = None
         try:
             # Validate that we have input files
             self.request.validate_inputs()
@@ -187,23 +221,17 @@ class OceanInMemoryRepository(OceanRepository[T, ID]):
 
             # Parse JSON content to DTO objects
             try:
-                raw_data = json.loads(content)
+                raw_data = orjson.loads(content)
                 if not isinstance(raw_data, list):
                     raise ParsingError(f"Input data must be a JSON array of {dto_class.__name__} objects")
 
-                # Convert raw data to DTO objects
-                dto_requests = []
-                for item in raw_data:
-                    # Create DTO from dictionary
-                    request_dto = dto_class(**item)
-                    dto_requests.append(request_dto)
+                # Validate the whole array into DTO objects in one call
+                dto_requests = _get_list_adapter(dto_class).validate_python(raw_data)
 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 raise ParsingError(f"Failed to parse input as JSON: {e}")
             except PydanticValidationError as e:
                 raise ValidationError(f"Invalid {dto_class.__name__} data: {e}")
-            except TypeError as e:
-                raise ValidationError(f"Invalid {dto_class.__name__} data structure: {e}")
 
             # Map to entities and store in internal storage
             self._entities = self.mapper.map_to_entities(dto_requests)
@@ -218,3 +246,39 @@ class OceanInMemoryRepository(OceanRepository[T, ID]):
             # Reset loaded flag on error
             self._loaded = False
             raise FileOperationError(f"Unexpected error reading input files: {e}")
+
+    def _get_entity_id(self, entity: T) -> Optional[ID]:
+        """
+        Get the identifier of an entity for the lookup index.
+
+        Default implementation returns None, meaning entities are not indexed.
+        Subclasses should override if entities have identifiers.
+
+        Args:
+            entity: The entity to identify
+
+        Returns:
+            The entity identifier, or None if it has none
+        """
+        return None
+
+    def _get_index(self) -> Dict[ID, T]:
+        """
+        Get the identifier index of the loaded entities, building it on first use.
+
+        Automatically loads data from Ocean Protocol inputs if not already loaded.
+        When identifiers repeat, the first loaded entity wins.
+
+        Returns:
+            Mapping of identifier to entity
+        """
+        self._ensure_loaded()
+        if self._index is None:
+            index: Dict[ID, T] = {}
+            for entity in self._entities:
+                entity_id = self._get_entity_id(entity)
+                if entity_id is not None and entity_id not in index:
+                    index[entity_id] = entity
+            self._index = index
+        return self._index
+
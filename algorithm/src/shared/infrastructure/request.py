@@ -63,10 +63,12 @@ class Request:
         """
         Count the number of input files.
         
+        Sums the per-DID file counts instead of walking inputs().
+        
         Returns:
             Number of input files available
         """
-        return len(list(self.algorithm.job_details.inputs()))
+        return sum(len(files) for files in self.algorithm.job_details.files)
     
     def get_content(self, index: int) -> str:
         """
@@ -87,7 +89,7 @@ class Request:
             raise ValidationError(f"Index {index} out of range (0-{len(inputs)-1})")
         
         idx, path = inputs[index]
-        self.logger.info(f"Reading input {idx}: {path.name}")
+        self.logger.info("Reading input %s: %s", idx, path.name)
         return self.file_reader.read_text(path)
     
     def iter_files(self) -> Iterator[tuple[int, Path]]:
@@ -115,7 +117,7 @@ class Request:
         """
         contents = []
         for idx, path in self.algorithm.job_details.inputs():
-            self.logger.info(f"Reading input {idx}: {path.name}")
+            self.logger.info("Reading input %s: %s", idx, path.name)
             content = self.file_reader.read_text(path)
             contents.append(content)
         
@@ -142,7 +144,7 @@ class Request:
         
         batch = []
         for idx, path in self.algorithm.job_details.inputs():
-            self.logger.info(f"Reading input {idx}: {path.name}")
+            self.logger.info("Reading input %s: %s", idx, path.name)
             content = self.file_reader.read_text(path)
             batch.append(content)
             
@@ -204,7 +206,7 @@ class Request:
                 # For now, we'll skip URL parsing as paths are local after download
                 pass
         except Exception as e:
-            self.logger.warning(f"Could not extract dataset query parameters: {e}")
+            self.logger.warning("Could not extract dataset query parameters: %s", e)
         
         return params
     
@@ -224,7 +226,7 @@ class Request:
         custom_data_path = Path("/data/inputs/algoCustomData.json")
         
         if not custom_data_path.exists():
-            self.logger.debug(f"No custom data file found at {custom_data_path}")
+            self.logger.debug("No custom data file found at %s", custom_data_path)
             return {}
         
         try:
@@ -41,15 +41,14 @@ class ResponseWriter:
             raise ValidationError(f"Output path must be a Path object, got {type(output_path)}")
 
         try:
-            # Ensure parent directory exists
-            if not output_path.parent.exists():
-                output_path.parent.mkdir(parents=True, exist_ok=True)
+            # Ensure parent directory exists (exist_ok makes a prior check redundant)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Write the JSON file using output configuration
             json_content = results.model_dump_json(indent=self.output_config.indent)
             output_path.write_text(json_content, encoding=self.output_config.encoding)
 
-            self.logger.info(f"Results written to {output_path}")
+            self.logger.info("Results written to %s", output_path)
 
         except Exception as e:
             raise FileOperationError(f"Error writing results to {output_path}: {e}")
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""Unit tests for CalculateAgeStatisticsAction."""
+
+import statistics
+
+import numpy as np
+import pytest
+from unittest.mock import Mock
+
+from age_average.application.calculate_age_statistics_action import CalculateAgeStatisticsAction
+from age_average.domain.age_repository_interface import AgeRepositoryInterface
+from age_average.domain.age_response_dto import AgeResponseDTO
+
+
+class TestCalculateAgeStatisticsAction:
+    """Test suite for CalculateAgeStatisticsAction."""
+
+    @pytest.fixture
+    def mock_repository(self):
+        """Create a mock repository instance."""
+        mock_repository = Mock(spec=AgeRepositoryInterface)
+        mock_repository.find_all_ages_array.return_value = np.empty(0, dtype=np.uint8)
+        return mock_repository
+
+    @pytest.fixture
+    def action(self, mock_repository):
+        """Create a CalculateAgeStatisticsAction instance for testing."""
+        return CalculateAgeStatisticsAction(mock_repository)
+
+    def test_execute_with_valid_data_returns_correct_stats(self, action, mock_repository):
+        """Test that statistics are calculated from the repository ages column."""
+        mock_repository.find_all_ages_array.return_value = np.array([25, 30, 36], dtype=np.uint8)
+
+        result = action.execute()
+
+        assert isinstance(result, AgeResponseDTO)
+        assert result.status == "success"
+        assert result.message == "Statistics calculated from 3 records"
+        assert result.min_age == 25
+        assert result.max_age == 36
+        assert result.avg_age == 30.3
+
+    def test_execute_returns_native_python_types(self, action, mock_repository):
+        """Test that NumPy scalars are converted before building the DTO."""
+        mock_repository.find_all_ages_array.return_value = np.array([40], dtype=np.uint8)
+
+        result = action.execute()
+
+        assert type(result.min_age) is int
+        assert type(result.max_age) is int
+        assert type(result.avg_age) is float
+
+    def test_execute_sum_does_not_overflow_byte_column(self, action, mock_repository):
+        """Test that the average of a uint8 column is accumulated without overflow."""
+        mock_repository.find_all_ages_array.return_value = np.full(1000, 150, dtype=np.uint8)
+
+        result = action.execute()
+
+        assert result.min_age == 150
+        assert result.max_age == 150
+        assert result.avg_age == 150.0
+
+    def test_execute_average_matches_exact_mean(self, action, mock_repository):
+        """Test that the sum-then-divide average equals the exact rounded mean."""
+        ages = [(i * 37) % 151 for i in range(997)]
+        mock_repository.find_all_ages_array.return_value = np.array(ages, dtype=np.uint8)
+
+        result = action.execute()
+
+        assert result.avg_age == round(statistics.mean(ages), 1)
+
+    def test_execute_with_empty_data_returns_zero_stats(self, action):
+        """Test that empty input returns a success DTO with zeroed statistics."""
+        result = action.execute()
+
+        assert result.status == "success"
+        assert result.message == "No data available for statistics calculation"
+        assert result.min_age == 0
+        assert result.max_age == 0
+        assert result.avg_age == 0.0
+
+    def test_execute_with_repository_error_returns_error_dto(self, action, mock_repository):
+        """Test that repository failures are converted into an error DTO."""
+        mock_repository.find_all_ages_array.side_effect = RuntimeError("boom")
+
+        result = action.execute()
+
+        assert result.status == "error"
+        assert result.message == "Failed to calculate age statistics: boom"
+        assert result.min_age == 0
+        assert result.max_age == 0
+        assert result.avg_age == 0.0
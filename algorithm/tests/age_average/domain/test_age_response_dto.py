@@ -103,3 +103,27 @@ class TestAgeResponseDTO:
             avg_age=25.0
         )
         assert isinstance(results, ResponseDTO)
+    
+    def test_results_are_immutable(self):
+        """Test that AgeResponseDTO instances cannot be mutated."""
+        results = AgeResponseDTO(
+            status="success",
+            message="Test",
+            min_age=20,
+            max_age=30,
+            avg_age=25.0
+        )
+        with pytest.raises(ValidationError):
+            results.message = "changed"
+    
+    def test_error_factory_zeroes_statistics(self):
+        """Test that the error factory builds an error DTO with zeroed statistics."""
+        results = AgeResponseDTO.error("Something failed")
+        
+        assert isinstance(results, AgeResponseDTO)
+        assert results.status == "error"
+        assert results.message == "Something failed"
+        assert results.min_age == 0
+        assert results.max_age == 0
+        assert results.avg_age == 0.0
+        assert results.model_dump()["avg_age"] == 0.0
@@ -24,6 +24,12 @@ class TestUserAge:
         with pytest.raises(AttributeError):
             user_age.age = 30
 
+    def test_user_age_uses_slots(self):
+        """Test that UserAge instances have no per-instance __dict__."""
+        user_age = UserAge(user_id=1, age=25)
+
+        assert not hasattr(user_age, "__dict__")
+
     def test_user_age_equality(self):
         """Test that UserAge instances with same data are equal."""
         user_age1 = UserAge(user_id=1, age=25)
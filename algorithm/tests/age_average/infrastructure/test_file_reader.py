@@ -1,6 +1,7 @@
 """Unit tests for FileReader service."""
 
 import logging
+import os
 import tempfile
 import pytest
 from pathlib import Path
@@ -97,3 +98,19 @@ class TestFileReader:
             assert "Line 999" in content
         finally:
             temp_path.unlink()
+    
+    def test_read_text_from_directory_raises_error(self, reader):
+        """Test that reading a directory raises FileOperationError."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with pytest.raises(FileOperationError, match="Path is not a file"):
+                reader.read_text(Path(temp_dir))
+    
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="FIFOs are not supported on this platform")
+    def test_read_text_from_fifo_raises_error(self, reader):
+        """Test that a FIFO is rejected without blocking on open."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            fifo_path = Path(temp_dir) / "input.fifo"
+            os.mkfifo(fifo_path)
+            
+            with pytest.raises(FileOperationError, match="Path is not a file"):
+                reader.read_text(fifo_path)
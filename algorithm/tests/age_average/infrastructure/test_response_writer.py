@@ -7,6 +7,7 @@ import pytest
 from pathlib import Path
 from shared.infrastructure.response_writer import ResponseWriter
 from age_average.domain.age_response_dto import AgeResponseDTO
+from shared.domain.config.output_config import OutputConfig
 from shared.domain.exceptions.file_operation_error import FileOperationError
 
 
@@ -154,4 +155,21 @@ class TestResponseWriter:
             assert invalid_path.exists()
         except FileOperationError:
             # This is also acceptable
-            pass
\ No newline at end of file
+            pass
+
+    def test_write_json_with_custom_indent_uses_configured_indent(self, logger, sample_results):
+        """Test that the configured indent is used for serialization."""
+        writer = ResponseWriter(logger, OutputConfig(indent=4))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = Path(temp_dir) / "results.json"
+
+            writer.write_json(sample_results, output_path)
+
+            assert output_path.read_text(encoding="utf-8") == sample_results.model_dump_json(indent=4)
+
+    def test_write_json_with_unknown_encoding_raises_file_operation_error(self, logger, sample_results):
+        """Test that an unknown encoding is reported as a FileOperationError when writing."""
+        writer = ResponseWriter(logger, OutputConfig(encoding="bogus"))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with pytest.raises(FileOperationError):
+                writer.write_json(sample_results, Path(temp_dir) / "results.json")
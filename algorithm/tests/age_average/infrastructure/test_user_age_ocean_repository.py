@@ -1,11 +1,13 @@
 """Unit tests for UserAgeOceanRepository."""
 
 import json
+import numpy as np
 import pytest
 from unittest.mock import Mock, patch
 
 from age_average.infrastructure.user_age_ocean_repository import UserAgeOceanRepository
 from age_average.infrastructure.user_age_mapper import UserAgeMapper
+from age_average.domain.age_repository_interface import AgeRepositoryInterface
 from age_average.domain.age_request_dto import AgeRequestDTO
 from age_average.domain.user_age import UserAge
 from shared.infrastructure.request import Request
@@ -147,4 +149,78 @@ class TestUserAgeOceanRepository:
 
         # Verify
         assert result == []
-        assert isinstance(result, list)
\ No newline at end of file
+        assert isinstance(result, list)
+
+    def test_find_all_ages_array_returns_ages_column(self, mock_request, mapper, sample_json_data):
+        """Test that find_all_ages_array() exposes the loaded ages as a NumPy column."""
+        mock_request.get_content.return_value = sample_json_data
+        repo = UserAgeOceanRepository(request=mock_request, mapper=mapper)
+
+        ages = repo.find_all_ages_array()
+
+        assert isinstance(ages, np.ndarray)
+        assert ages.dtype == np.uint8
+        assert ages.tolist() == [25, 30, 35]
+        assert repo.find_all_ages_array() is ages
+
+    def test_find_all_ages_array_is_rebuilt_after_reload(self, mock_request, mapper, sample_json_data):
+        """Test that reloading input data invalidates the cached ages column."""
+        mock_request.get_content.side_effect = ["[]", sample_json_data]
+        repo = UserAgeOceanRepository(request=mock_request, mapper=mapper)
+        assert repo.find_all_ages_array().size == 0
+
+        repo.get_entities_from_input(AgeRequestDTO)
+
+        assert repo.find_all_ages_array().tolist() == [25, 30, 35]
+
+    def test_clear_resets_ages_column(self, mock_request, mapper, sample_json_data):
+        """Test that clear() empties the cached ages column."""
+        mock_request.get_content.return_value = sample_json_data
+        repo = UserAgeOceanRepository(request=mock_request, mapper=mapper)
+        assert repo.find_all_ages_array().size == 3
+
+        repo.clear()
+
+        assert repo.find_all_ages_array().size == 0
+
+    def test_find_all_ages_array_keeps_upper_age_bound(self, mock_request, mapper):
+        """Test that the maximum valid age survives the byte-sized column."""
+        mock_request.get_content.return_value = json.dumps([{"user_id": 1, "age": 150}])
+        repo = UserAgeOceanRepository(request=mock_request, mapper=mapper)
+
+        assert repo.find_all_ages_array().tolist() == [150]
+
+    def test_find_by_id_returns_entity_by_user_id(self, mock_request, mapper, sample_json_data):
+        """Test that entities can be looked up by user_id."""
+        mock_request.get_content.return_value = sample_json_data
+        repo = UserAgeOceanRepository(request=mock_request, mapper=mapper)
+
+        assert repo.find_by_id(2) == UserAge(user_id=2, age=30)
+        assert repo.find_by_id(99) is None
+        assert repo.exists_by_id(3) is True
+        assert repo.exists_by_id(99) is False
+
+    def test_find_by_ids_returns_found_entities(self, mock_request, mapper, sample_json_data):
+        """Test that batch lookup returns only the identifiers that exist."""
+        mock_request.get_content.return_value = sample_json_data
+        repo = UserAgeOceanRepository(request=mock_request, mapper=mapper)
+
+        result = repo.find_by_ids([1, 3, 99])
+
+        assert result == {1: UserAge(user_id=1, age=25), 3: UserAge(user_id=3, age=35)}
+
+    def test_reload_and_clear_invalidate_id_index(self, mock_request, mapper, sample_json_data):
+        """Test that the identifier index follows reloads and clear()."""
+        mock_request.get_content.side_effect = ["[]", sample_json_data]
+        repo = UserAgeOceanRepository(request=mock_request, mapper=mapper)
+        assert repo.find_by_id(1) is None
+
+        repo.get_entities_from_input(AgeRequestDTO)
+        assert repo.find_by_id(1) == UserAge(user_id=1, age=25)
+
+        repo.clear()
+        assert repo.find_by_id(1) is None
+
+    def test_implements_age_repository_interface(self, repository):
+        """Test that the repository satisfies the domain-level interface used by the action."""
+        assert isinstance(repository, AgeRepositoryInterface)
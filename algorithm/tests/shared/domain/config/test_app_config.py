@@ -0,0 +1,42 @@
+"""Unit tests for AppConfig."""
+
+import pytest
+from pydantic import ValidationError
+
+from shared.domain.config.app_config import AppConfig
+
+
+class TestAppConfig:
+    """Test suite for AppConfig loading."""
+
+    @pytest.fixture(autouse=True)
+    def clear_load_cache(self):
+        """Reset the cached configuration around each test."""
+        AppConfig.load.cache_clear()
+        yield
+        AppConfig.load.cache_clear()
+
+    def test_load_returns_app_config(self):
+        """Test that load resolves and validates the project configuration."""
+        config = AppConfig.load()
+
+        assert isinstance(config, AppConfig)
+
+    def test_load_is_cached(self):
+        """Test that repeated load calls return the same instance."""
+        assert AppConfig.load() is AppConfig.load()
+
+    def test_from_yaml_is_not_cached(self):
+        """Test that from_yaml always builds a fresh instance."""
+        config_path = AppConfig._resolve_config_path()
+
+        assert AppConfig.from_yaml(config_path) is not AppConfig.from_yaml(config_path)
+
+    def test_loaded_config_is_immutable(self):
+        """Test that the shared cached instance cannot be modified."""
+        config = AppConfig.load()
+
+        with pytest.raises(ValidationError):
+            config.output = config.output.model_copy()
+        with pytest.raises(ValidationError):
+            config.performance.monitoring_enabled = False
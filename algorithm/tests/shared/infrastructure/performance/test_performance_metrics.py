@@ -0,0 +1,39 @@
+"""Unit tests for PerformanceMetrics data model."""
+
+import dataclasses
+
+import pytest
+
+from shared.infrastructure.performance.performance_metrics import PerformanceMetrics
+
+
+class TestPerformanceMetrics:
+    """Test suite for PerformanceMetrics."""
+
+    @pytest.fixture
+    def metrics(self):
+        """Create sample PerformanceMetrics for testing."""
+        return PerformanceMetrics(
+            execution_time_seconds=1.23456,
+            memory_usage_mb=10.5678,
+            peak_memory_usage_mb=20.1234,
+            cpu_percent=55.555,
+        )
+
+    def test_to_dict_rounds_values(self, metrics):
+        """Test that to_dict rounds values for logging."""
+        assert metrics.to_dict() == {
+            'execution_time_seconds': 1.235,
+            'memory_usage_mb': 10.57,
+            'peak_memory_usage_mb': 20.12,
+            'cpu_percent': 55.55,
+        }
+
+    def test_metrics_are_immutable(self, metrics):
+        """Test that PerformanceMetrics instances cannot be modified."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            metrics.cpu_percent = 0.0
+
+    def test_metrics_use_slots(self, metrics):
+        """Test that PerformanceMetrics instances have no per-instance __dict__."""
+        assert not hasattr(metrics, "__dict__")
@@ -0,0 +1,81 @@
+"""Unit tests for PerformanceMonitor service."""
+
+import pytest
+from unittest.mock import Mock
+
+from shared.infrastructure.performance.performance_metrics import PerformanceMetrics
+from shared.infrastructure.performance.performance_monitor import PerformanceMonitor
+
+
+class TestPerformanceMonitor:
+    """Test suite for PerformanceMonitor service."""
+
+    @pytest.fixture
+    def logger(self):
+        """Create a mock logger for testing."""
+        return Mock()
+
+    @pytest.fixture
+    def monitor(self, logger):
+        """Create a PerformanceMonitor instance for testing."""
+        return PerformanceMonitor(logger)
+
+    def test_get_metrics_returns_performance_metrics(self, monitor):
+        """Test that get_metrics returns a populated PerformanceMetrics."""
+        metrics = monitor.get_metrics()
+
+        assert isinstance(metrics, PerformanceMetrics)
+        assert metrics.execution_time_seconds >= 0
+        assert metrics.peak_memory_usage_mb > 0
+
+    def test_get_metrics_reads_memory_once(self, monitor):
+        """Test that get_metrics samples process memory a single time."""
+        memory_info = Mock(return_value=Mock(rss=monitor.memory_start + 1024 * 1024))
+        monitor.process = Mock(memory_info=memory_info, cpu_percent=Mock(return_value=0.0))
+
+        metrics = monitor.get_metrics()
+
+        memory_info.assert_called_once()
+        assert metrics.memory_usage_mb == 1.0
+        assert monitor.peak_memory == monitor.memory_start + 1024 * 1024
+
+    def test_get_metrics_samples_cpu_without_blocking(self, monitor):
+        """Test that CPU usage is read non-blocking since the previous sample."""
+        cpu_percent = Mock(return_value=12.5)
+        monitor.process = Mock(
+            memory_info=Mock(return_value=Mock(rss=monitor.memory_start)),
+            cpu_percent=cpu_percent,
+        )
+
+        metrics = monitor.get_metrics()
+
+        cpu_percent.assert_called_once_with(interval=None)
+        assert metrics.cpu_percent == 12.5
+
+    def test_update_peak_memory_returns_current_rss(self, monitor):
+        """Test that update_peak_memory keeps the maximum and returns the current reading."""
+        monitor.peak_memory = monitor.memory_start * 2
+        monitor.process = Mock(memory_info=Mock(return_value=Mock(rss=monitor.memory_start)))
+
+        current = monitor.update_peak_memory()
+
+        assert current == monitor.memory_start
+        assert monitor.peak_memory == monitor.memory_start * 2
+
+    def test_log_final_metrics_logs_completed_status(self, monitor, logger):
+        """Test that final metrics are logged with a completed status."""
+        monitor.log_final_metrics()
+
+        logger.info.assert_called_once()
+        assert logger.info.call_args.kwargs["extra"]["status"] == "completed"
+
+    def test_log_final_metrics_skips_work_when_info_disabled(self, monitor, logger):
+        """Test that metrics are not collected when INFO records would be dropped."""
+        logger.isEnabledFor.return_value = False
+        monitor.process = Mock()
+
+        monitor.log_final_metrics()
+        monitor.log_metrics()
+
+        monitor.process.memory_info.assert_not_called()
+        logger.info.assert_not_called()
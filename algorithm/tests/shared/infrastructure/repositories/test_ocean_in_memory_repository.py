@@ -214,3 +214,31 @@ class TestOceanInMemoryRepository:
         
         with pytest.raises(ParsingError, match="Input data must be a JSON array"):
             repository.get_entities_from_input(SampleDTO)
+
+    def test_get_entities_from_input_non_object_items(self, repository, mock_request):
+        """Test that array items that are not objects raise ValidationError."""
+        mock_request.validate_inputs.return_value = None
+        mock_request.get_content.return_value = '[1, 2, 3]'
+        
+        with pytest.raises(ValidationError, match="Invalid SampleDTO data"):
+            repository.get_entities_from_input(SampleDTO)
+
+    def test_get_entities_from_input_stops_at_first_invalid_item(self, repository, mock_request):
+        """Test that a large invalid array yields a single validation error."""
+        mock_request.get_content.return_value = json.dumps([{"id": "x", "name": "Test"}] * 10000)
+
+        with pytest.raises(ValidationError, match="1 validation error for") as exc_info:
+            repository.get_entities_from_input(SampleDTO)
+
+        assert len(str(exc_info.value)) < 1000
+
+    def test_get_entities_from_input_passes_dtos_to_mapper(self, repository, mock_request, mock_mapper):
+        """Test that validated DTO instances are handed to the mapper on every reload."""
+        mock_request.get_content.return_value = json.dumps([{"id": 1, "name": "Test"}])
+        
+        repository.get_entities_from_input(SampleDTO)
+        repository.get_entities_from_input(SampleDTO)
+        
+        dto_requests = mock_mapper.map_to_entities.call_args[0][0]
+        assert dto_requests == [SampleDTO(id=1, name="Test")]
+        assert isinstance(dto_requests[0], SampleDTO)
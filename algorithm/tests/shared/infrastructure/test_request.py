@@ -42,19 +42,18 @@ class TestRequest:
     
     def test_count_with_no_files(self, request_wrapper, mock_algorithm):
         """Test count returns zero when no input files."""
-        mock_algorithm.job_details.inputs.return_value = iter([])
+        mock_algorithm.job_details.files = []
         
         count = request_wrapper.count()
         
         assert count == 0
     
     def test_count_with_multiple_files(self, request_wrapper, mock_algorithm):
-        """Test count returns correct number of input files."""
-        mock_algorithm.job_details.inputs.return_value = iter([
-            (0, Path("/tmp/file1.txt")),
-            (1, Path("/tmp/file2.txt")),
-            (2, Path("/tmp/file3.txt"))
-        ])
+        """Test count adds up the input files of every DID."""
+        mock_algorithm.job_details.files = [
+            [Path("/tmp/file1.txt")],
+            [Path("/tmp/file2.txt"), Path("/tmp/file3.txt")]
+        ]
         
         count = request_wrapper.count()
         
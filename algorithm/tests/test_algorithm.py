@@ -68,3 +68,34 @@ class TestAlgorithm:
         
         # This demonstrates that different algorithm implementations
         # could be used interchangeably through the interface
+    
+    def test_performance_monitoring_enabled_by_default(self):
+        """Test that performance monitoring follows the default configuration."""
+        from unittest.mock import Mock
+        from shared.domain.config.test_config import DefaultTestConfig
+        
+        age_algorithm = AgeAverageAlgorithm.create(DefaultTestConfig.create())
+        age_algorithm.start_performance_monitoring(Mock())
+        
+        assert age_algorithm.performance_monitoring_enabled is True
+        assert age_algorithm.performance_monitor is not None
+    
+    def test_performance_monitoring_can_be_disabled(self):
+        """Test that disabling monitoring in config skips PerformanceMonitor."""
+        from unittest.mock import Mock
+        from shared.domain.config.test_config import DefaultTestConfig
+        from shared.domain.config.algorithm_config import AlgorithmConfig
+        from shared.domain.config.performance_config import PerformanceConfig
+        
+        config = DefaultTestConfig(
+            algorithm=AlgorithmConfig(
+                name="test_algorithm",
+                version="1.0.0",
+                description="Test algorithm for unit tests"
+            ),
+            performance=PerformanceConfig(monitoring_enabled=False)
+        )
+        age_algorithm = AgeAverageAlgorithm.create(config)
+        age_algorithm.start_performance_monitoring(Mock())
+        
+        assert age_algorithm.performance_monitor is None